@@ -7,7 +7,158 @@ Supports both forward (5'→3') and reverse complement (3'→5') matching
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import csv
-from typing import List, Dict, Tuple
+from array import array
+import itertools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
+
+try:
+    import hyperscan
+    _HS_AVAILABLE = True
+except ImportError:
+    # Optional speed-up; fall back to Aho-Corasick, Numba or per-sequence scans
+    _HS_AVAILABLE = False
+
+try:
+    import ahocorasick
+    _AC_AVAILABLE = True
+except ImportError:
+    # Optional speed-up; fall back to Numba or per-sequence scans
+    _AC_AVAILABLE = False
+
+try:
+    import numpy as np
+    from numba import cuda, njit, prange, uint8
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    # Optional speed-up used when neither hyperscan nor pyahocorasick is
+    # installed; fall back to one str.find scan per distinct sequence
+    _NUMBA_AVAILABLE = False
+
+# Optional GPU backend for very large targets; needs a working CUDA driver
+_CUDA_AVAILABLE = _NUMBA_AVAILABLE and cuda.is_available()
+
+# Valid nucleotide bytes, deleted in one C-level pass during validation
+_VALID_BASES = b'ATGCatgc'
+
+# Complement table mapping either case to the upper-case complement
+_COMPLEMENT_TABLE = str.maketrans('ATGCatgc', 'TACGTACG')
+_COMPLEMENT_BYTES = bytes.maketrans(b'ATGCatgc', b'TACGTACG')
+
+# Deletion table dropping whitespace from pasted sequences in one pass
+_WHITESPACE_TABLE = str.maketrans('', '', ' \t\n\r\f\v')
+
+# Base -> base-4 digit table, so int(seq.translate(...), 4) packs a
+# sequence 2 bits per base; up to 32 bases fit in one 64-bit word
+_BASE_DIGITS = str.maketrans('ACGT', '0123')
+_MAX_PACKED_LENGTH = 32
+
+# Target bases per scan chunk; scans check for cancellation between
+# chunks, which also lets the Tk thread run during GIL-holding scans
+_SCAN_CHUNK = 1 << 20
+
+# Hits between cancellation checks in scans that report hits one by one
+_CANCEL_CHECK_INTERVAL = 4096
+
+# Match types indexed by orientation code: 0 forward, 1 reverse complement
+_MATCH_TYPES = ("5′→3′", "3′→5′")
+
+# Matches inserted into the results table per page; further pages are
+# inserted as the table is scrolled to the bottom
+_RESULTS_PAGE_SIZE = 1000
+
+# GPU search settings: targets must exceed the minimum length to be worth
+# the device transfer, and each block stages CUDA_THREADS target bases plus
+# enough overlap for the longest supported pattern in shared memory
+_CUDA_MIN_TARGET_LENGTH = 10_000_000
+_CUDA_MAX_PATTERN_LENGTH = 256
+_CUDA_THREADS = 256
+_CUDA_TILE_SPAN = _CUDA_THREADS + _CUDA_MAX_PATTERN_LENGTH - 1
+
+if _NUMBA_AVAILABLE:
+    # Upper-case base byte -> 2-bit code lookup table (A=0, C=1, G=2, T=3)
+    _BASE_CODES = np.zeros(256, dtype=np.uint8)
+    for _code, _base in enumerate(b'ACGT'):
+        _BASE_CODES[_base] = _code
+
+    @njit(parallel=True, cache=True)
+    def _scan_kernel(target, probe, out_hits):
+        """Flag every 0-based start position in target where probe matches"""
+        m = probe.shape[0]
+        for i in prange(target.shape[0] - m + 1):
+            hit = True
+            for k in range(m):
+                if target[i + k] != probe[k]:
+                    hit = False
+                    break
+            out_hits[i] = hit
+
+    @njit(cache=True, nogil=True)
+    def _rolling_scan_kernel(target, m, keys, out_starts, out_key_ids):
+        """
+        Slide an m-base window over target, packed 2 bits per base into one
+        uint64, and look each window up in the sorted pattern keys. Writes
+        0-based starts and key indexes while capacity lasts and returns the
+        total number of hits
+        """
+        if m == 32:
+            mask = np.uint64(0xFFFFFFFFFFFFFFFF)
+        else:
+            mask = (np.uint64(1) << np.uint64(2 * m)) - np.uint64(1)
+        window = np.uint64(0)
+        count = 0
+        capacity = out_starts.shape[0]
+        for i in range(target.shape[0]):
+            window = ((window << np.uint64(2)) | np.uint64(target[i])) & mask
+            if i + 1 >= m:
+                j = np.searchsorted(keys, window)
+                if j < keys.shape[0] and keys[j] == window:
+                    if count < capacity:
+                        out_starts[count] = i - m + 1
+                        out_key_ids[count] = j
+                    count += 1
+        return count
+
+    @cuda.jit
+    def _cuda_scan_kernel(target, patterns, offsets, out_pattern_ids, out_starts, counter):
+        """
+        Match every pattern at one target position per thread. Patterns are
+        concatenated in patterns and delimited by offsets; hits are
+        compacted through an atomic counter, which may exceed the buffer
+        capacity to signal overflow
+        """
+        tile = cuda.shared.array(_CUDA_TILE_SPAN, dtype=uint8)
+        tx = cuda.threadIdx.x
+        base = cuda.blockIdx.x * _CUDA_THREADS
+        n = target.shape[0]
+        
+        # Cooperatively stage this block's window of the target
+        for k in range(tx, _CUDA_TILE_SPAN, _CUDA_THREADS):
+            if base + k < n:
+                tile[k] = target[base + k]
+        cuda.syncthreads()
+        
+        i = base + tx
+        if i >= n:
+            return
+        capacity = out_starts.shape[0]
+        for p in range(offsets.shape[0] - 1):
+            start = offsets[p]
+            m = offsets[p + 1] - start
+            if i + m > n:
+                continue
+            hit = True
+            for k in range(m):
+                if tile[tx + k] != patterns[start + k]:
+                    hit = False
+                    break
+            if hit:
+                slot = cuda.atomic.add(counter, 0, 1)
+                if slot < capacity:
+                    out_pattern_ids[slot] = p
+                    out_starts[slot] = i
 
 
 class ProbeMatcherApp:
@@ -20,9 +171,23 @@ class ProbeMatcherApp:
         self.root.resizable(True, True)
         
         # Data storage
-        self.probes = []  # List of dicts: {'name': str, 'sequence': str}
-        self.matches = []  # List of match results
+        self.probe_names = []  # List of probe names, parallel to probe_seqs
+        self.probe_seqs = []  # List of upper-case probe sequences
+        self.probe_revcomps = []  # Reverse complements, computed once at load
+        # Match results as parallel compact arrays: probe index, orientation
+        # code (index into _MATCH_TYPES) and 1-based start position
+        self.match_probe_idxs = array('i')
+        self.match_orientations = array('B')
+        self.match_starts = array('q')
+        self.match_source = None  # (target_seq, probe_names, probe_seqs) the matches refer to
+        self.rows_shown = 0  # Number of matches inserted into the results table
         self.probe_file_path = None
+        self.cancel_event = None  # Set to stop the running search
+        
+        # Compile the scan kernels up front so the first search is not
+        # delayed, but only when Numba is the backend that will be used
+        if _NUMBA_AVAILABLE and not (_HS_AVAILABLE or _AC_AVAILABLE):
+            self._scan_numba(["A", "A" * (_MAX_PACKED_LENGTH + 1)], b"A" * (_MAX_PACKED_LENGTH + 1))
         
         # Setup GUI
         self.setup_gui()
@@ -100,6 +265,14 @@ class ProbeMatcherApp:
         )
         self.search_btn.pack(side="left", padx=5)
         
+        self.cancel_btn = ttk.Button(
+            button_frame,
+            text="⏹ Cancel",
+            command=self.cancel_search,
+            state="disabled"
+        )
+        self.cancel_btn.pack(side="left", padx=5)
+        
         self.save_btn = ttk.Button(
             button_frame,
             text="💾 Save Results",
@@ -149,7 +322,8 @@ class ProbeMatcherApp:
         # Add scrollbars
         vsb = ttk.Scrollbar(results_frame, orient="vertical", command=self.tree.yview)
         hsb = ttk.Scrollbar(results_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self.tree_vsb = vsb
+        self.tree.configure(yscrollcommand=self._on_tree_scroll, xscrollcommand=hsb.set)
         
         # Grid layout for tree and scrollbars
         self.tree.grid(row=0, column=0, sticky="nsew")
@@ -166,8 +340,8 @@ class ProbeMatcherApp:
         
     def is_valid_sequence(self, sequence: str) -> bool:
         """Check if sequence contains only valid nucleotides (A, T, G, C)"""
-        valid_bases = set('ATGCatgc')
-        return all(base in valid_bases for base in sequence)
+        # Deleting every valid base leaves nothing behind for a valid sequence
+        return sequence.isascii() and not sequence.encode('ascii').translate(None, _VALID_BASES)
     
     def upload_probe_csv(self):
         """Handle probe CSV file upload"""
@@ -181,7 +355,9 @@ class ProbeMatcherApp:
         
         try:
             # Read CSV file
-            self.probes = []
+            self.probe_names = []
+            self.probe_seqs = []
+            self.probe_revcomps = []
             invalid_probes = []
             
             with open(file_path, 'r', encoding='utf-8-sig') as f:
@@ -200,30 +376,27 @@ class ProbeMatcherApp:
                     for keyword in ['probe', 'name', 'sequence', 'id', 'label']
                 )
                 
-                # If not a header, process it as data
-                if not is_header and len(first_row) >= 2:
-                    name = first_row[0].strip()
-                    seq = first_row[1].strip().upper()
-                    
-                    if name and seq:
-                        if self.is_valid_sequence(seq):
-                            self.probes.append({'name': name, 'sequence': seq})
-                        else:
-                            invalid_probes.append((name, seq))
+                # If not a header, put the first row back in front of the stream
+                rows = reader if is_header else itertools.chain([first_row], reader)
                 
-                # Process remaining rows
-                for row_num, row in enumerate(reader, start=2):
-                    if len(row) >= 2 and row[0].strip() and row[1].strip():
-                        name = row[0].strip()
-                        seq = row[1].strip().upper()
-                        
-                        if self.is_valid_sequence(seq):
-                            self.probes.append({'name': name, 'sequence': seq})
-                        else:
-                            invalid_probes.append((name, seq))
+                # Validate and collect every data row in a single pass
+                for row in rows:
+                    if len(row) < 2:
+                        continue
+                    name = row[0].strip()
+                    seq = row[1].strip().upper()
+                    if not (name and seq):
+                        continue
+                    
+                    if self.is_valid_sequence(seq):
+                        self.probe_names.append(name)
+                        self.probe_seqs.append(seq)
+                        self.probe_revcomps.append(self.reverse_complement(seq))
+                    else:
+                        invalid_probes.append((name, seq))
             
             # Report results
-            if not self.probes and not invalid_probes:
+            if not self.probe_seqs and not invalid_probes:
                 messagebox.showerror("Error", "No valid probe data found in CSV file.")
                 return
             
@@ -235,8 +408,8 @@ class ProbeMatcherApp:
                 message = f"Found {len(invalid_probes)} probe(s) with invalid sequences.\n\n"
                 message += "Invalid probes (only A, T, G, C allowed):\n" + invalid_list
                 
-                if self.probes:
-                    message += f"\n\n{len(self.probes)} valid probe(s) were loaded successfully."
+                if self.probe_seqs:
+                    message += f"\n\n{len(self.probe_seqs)} valid probe(s) were loaded successfully."
                     messagebox.showwarning("Warning", message)
                 else:
                     message += "\n\nNo valid probes found. Please check your CSV file."
@@ -245,18 +418,18 @@ class ProbeMatcherApp:
                     return
             
             self.probe_file_path = file_path
-            file_name = file_path.split('/')[-1]
+            file_name = os.path.basename(file_path)
             self.probe_label.config(
-                text=f"✓ {file_name} ({len(self.probes)} probes loaded)",
+                text=f"✓ {file_name} ({len(self.probe_seqs)} probes loaded)",
                 foreground="green"
             )
             self.search_btn.config(state="normal")
-            self.status_label.config(text=f"Loaded {len(self.probes)} probes", foreground="green")
+            self.status_label.config(text=f"Loaded {len(self.probe_seqs)} probes", foreground="green")
             
             if not invalid_probes:
                 messagebox.showinfo(
                     "Success",
-                    f"Successfully loaded {len(self.probes)} probes from {file_name}"
+                    f"Successfully loaded {len(self.probe_seqs)} probes from {file_name}"
                 )
             
         except Exception as e:
@@ -264,121 +437,464 @@ class ProbeMatcherApp:
             self.probe_label.config(text="Error loading file", foreground="red")
     
     def reverse_complement(self, sequence: str) -> str:
-        """Calculate reverse complement of a DNA sequence"""
-        complement = {'A': 'T', 'T': 'A', 'G': 'C', 'C': 'G'}
-        try:
-            rev_comp = ''.join(complement[base] for base in reversed(sequence.upper()))
-            return rev_comp
-        except KeyError:
-            # If invalid nucleotide found, return empty string
-            return ""
+        """
+        Calculate reverse complement of a DNA sequence
+        Sequence is expected to be validated with is_valid_sequence
+        """
+        return sequence.translate(_COMPLEMENT_TABLE)[::-1]
     
-    def find_matches(self, probe_seq: str, target_seq: str) -> List[Tuple[int, int, str]]:
+    def find_matches(self, probe_seq: bytes, target_seq: bytes,
+                     rev_comp: Optional[bytes] = None) -> Tuple[array, array]:
         """
-        Find all occurrences of probe_seq in target_seq
-        Returns list of tuples: (start_pos, end_pos, match_type)
-        Positions are 1-based
+        Find all occurrences of probe_seq and its reverse complement in target_seq
+        Returns tuple of arrays: (5′→3′ start positions, 3′→5′ start positions)
+        Positions are 1-based; sequences must be upper-case ASCII bytes.
+        rev_comp is computed from probe_seq when not given
         """
-        matches = []
-        probe_upper = probe_seq.upper()
-        target_upper = target_seq.upper()
+        forward = array('q')
+        reverse = array('q')
+        
+        # Each find() resumes just past the previous hit, so overlapping
+        # matches never rescan the target. A lookahead re.finditer was
+        # measured slower for the usual sparse hits and no faster for dense ones
         
         # Search for forward matches (5'→3')
         start = 0
         while True:
-            pos = target_upper.find(probe_upper, start)
+            pos = target_seq.find(probe_seq, start)
             if pos == -1:
                 break
-            matches.append((pos + 1, pos + len(probe_upper), "5′→3′"))
+            forward.append(pos + 1)
             start = pos + 1
         
         # Search for reverse complement matches (3'→5')
-        rev_comp = self.reverse_complement(probe_seq)
-        if rev_comp:
+        # Palindromes are reported once, as forward matches
+        if rev_comp is None:
+            rev_comp = probe_seq.translate(_COMPLEMENT_BYTES)[::-1]
+        if rev_comp != probe_seq:
             start = 0
             while True:
-                pos = target_upper.find(rev_comp, start)
+                pos = target_seq.find(rev_comp, start)
                 if pos == -1:
                     break
-                matches.append((pos + 1, pos + len(rev_comp), "3′→5′"))
+                reverse.append(pos + 1)
                 start = pos + 1
         
-        return matches
+        return forward, reverse
+    
+    def _scan_hyperscan(self, patterns: List[str], target_bytes: bytes,
+                        cancel_event: Optional[threading.Event] = None) -> List[array]:
+        """
+        Scan target_bytes for all patterns with a Hyperscan literal database
+        Returns one array of ascending 1-based start positions per pattern;
+        partial if cancelled
+        """
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[pattern.encode('ascii') for pattern in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            literal=True
+        )
+        lengths = [len(pattern) for pattern in patterns]
+        pattern_starts = [array('q') for _ in patterns]
+        overlap = max(lengths) - 1
+        
+        def on_match(pattern_idx, start, end, flags, context):
+            # Literal lengths are known, so the start offset is derived from
+            # the end offset instead of paying for SOM tracking. Matches
+            # arrive in end offset order, so each column stays sorted.
+            # Hits ending in the overlap were reported by the previous chunk
+            if offset + end > lo:
+                pattern_starts[pattern_idx].append(offset + end - lengths[pattern_idx] + 1)
+            # Returning True asks Hyperscan to stop the scan
+            return cancel_event is not None and cancel_event.is_set()
+        
+        # Scan in chunks so cancellation is checked even when nothing
+        # matches; each chunk also rescans the previous chunk's last
+        # overlap bytes so matches spanning the boundary are found
+        for lo in range(0, len(target_bytes), _SCAN_CHUNK):
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            offset = max(0, lo - overlap)
+            try:
+                database.scan(target_bytes[offset:lo + _SCAN_CHUNK], match_event_handler=on_match)
+            except hyperscan.ScanTerminated:
+                break
+        return pattern_starts
+    
+    def _scan_aho_corasick(self, patterns: List[str], target_seq: str,
+                           cancel_event: Optional[threading.Event] = None) -> List[array]:
+        """
+        Scan target_seq for all patterns with an Aho-Corasick automaton
+        Returns one array of ascending 1-based start positions per pattern;
+        partial if cancelled
+        """
+        automaton = ahocorasick.Automaton()
+        for pattern_idx, pattern in enumerate(patterns):
+            automaton.add_word(pattern, (pattern_idx, len(pattern)))
+        automaton.make_automaton()
+        
+        pattern_starts = [array('q') for _ in patterns]
+        overlap = max(map(len, patterns)) - 1
+        hit_count = 0
+        # iter() holds the GIL until it yields a hit, so the target is fed
+        # in chunks; each chunk also rescans the previous chunk's last
+        # overlap bases and keeps only hits ending inside the chunk. Chunks
+        # are sliced because iter()'s start/end arguments copy the whole
+        # target on every call
+        for lo in range(0, len(target_seq), _SCAN_CHUNK):
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            offset = max(0, lo - overlap)
+            chunk = target_seq[offset:lo + _SCAN_CHUNK]
+            for end_idx, (pattern_idx, length) in automaton.iter(chunk):
+                if end_idx + offset < lo:
+                    continue
+                pattern_starts[pattern_idx].append(end_idx + offset - length + 2)
+                hit_count += 1
+                # Check for cancellation every few thousand hits
+                if cancel_event is not None and not hit_count % _CANCEL_CHECK_INTERVAL and cancel_event.is_set():
+                    return pattern_starts
+        return pattern_starts
+    
+    def _group_hits(self, pattern_ids, starts, pattern_starts: List[array]):
+        """
+        Append NumPy hit arrays of pattern indexes and 1-based starts,
+        ascending by start within each pattern, to the per-pattern columns
+        """
+        order = np.argsort(pattern_ids, kind='stable')
+        pattern_ids = pattern_ids[order]
+        starts = starts[order].astype(np.int64, copy=False)
+        unique_ids, first = np.unique(pattern_ids, return_index=True)
+        for pattern_idx, group in zip(unique_ids.tolist(), np.split(starts, first[1:])):
+            pattern_starts[pattern_idx].frombytes(group.tobytes())
+    
+    def _scan_cuda(self, patterns: List[str], target_bytes: bytes) -> List[array]:
+        """
+        Scan target_bytes for all patterns with the CUDA scan kernel
+        Returns one array of ascending 1-based start positions per pattern
+        """
+        target_array = np.frombuffer(target_bytes, dtype=np.uint8)
+        pattern_bytes = np.frombuffer(''.join(patterns).encode('ascii'), dtype=np.uint8)
+        offsets = np.zeros(len(patterns) + 1, dtype=np.int64)
+        np.cumsum([len(pattern) for pattern in patterns], out=offsets[1:])
+        
+        d_target = cuda.to_device(target_array)
+        d_patterns = cuda.to_device(pattern_bytes)
+        d_offsets = cuda.to_device(offsets)
+        blocks = (len(target_array) + _CUDA_THREADS - 1) // _CUDA_THREADS
+        
+        # Rerun with exact capacity if the first guess was too small
+        capacity = 1 << 20
+        while True:
+            d_counter = cuda.to_device(np.zeros(1, dtype=np.int64))
+            d_pattern_ids = cuda.device_array(capacity, dtype=np.int64)
+            d_starts = cuda.device_array(capacity, dtype=np.int64)
+            _cuda_scan_kernel[blocks, _CUDA_THREADS](
+                d_target, d_patterns, d_offsets, d_pattern_ids, d_starts, d_counter
+            )
+            count = int(d_counter.copy_to_host()[0])
+            if count <= capacity:
+                break
+            capacity = count
+        
+        # Hits are compacted in arbitrary order, so sort by start first
+        pattern_ids = d_pattern_ids.copy_to_host()[:count]
+        starts = d_starts.copy_to_host()[:count]
+        order = np.argsort(starts)
+        pattern_starts = [array('q') for _ in patterns]
+        self._group_hits(pattern_ids[order], starts[order] + 1, pattern_starts)
+        return pattern_starts
+    
+    def _scan_numba(self, patterns: List[str], target_bytes: bytes,
+                    cancel_event: Optional[threading.Event] = None) -> List[array]:
+        """
+        Scan target_bytes for all patterns with the Numba scan kernels
+        Returns one array of ascending 1-based start positions per pattern;
+        partial if cancelled
+        """
+        target_codes = _BASE_CODES[np.frombuffer(target_bytes, dtype=np.uint8)]
+        pattern_starts = [array('q') for _ in patterns]
+        
+        # Patterns that fit in one packed word are grouped by length, and
+        # each length is matched for all its patterns in one rolling scan
+        buckets: Dict[int, List[int]] = {}
+        for pattern_idx, pattern in enumerate(patterns):
+            if len(pattern) > len(target_codes):
+                continue
+            if len(pattern) <= _MAX_PACKED_LENGTH:
+                buckets.setdefault(len(pattern), []).append(pattern_idx)
+                continue
+            probe_codes = _BASE_CODES[np.frombuffer(pattern.encode('ascii'), dtype=np.uint8)]
+            n_starts = len(target_codes) - len(pattern) + 1
+            flags = np.zeros(n_starts, dtype=np.bool_)
+            for lo in range(0, n_starts, _SCAN_CHUNK):
+                if cancel_event is not None and cancel_event.is_set():
+                    return pattern_starts
+                hi = min(lo + _SCAN_CHUNK, n_starts)
+                _scan_kernel(target_codes[lo:hi + len(pattern) - 1], probe_codes, flags[lo:hi])
+            starts = (np.flatnonzero(flags) + 1).astype(np.int64, copy=False)
+            pattern_starts[pattern_idx].frombytes(starts.tobytes())
+        
+        # The rolling kernel releases the GIL, so target chunks of every
+        # bucket are scanned concurrently on all cores. Chunks are kept
+        # small, so a cancelled scan only waits for the chunks already running
+        workers = os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            bucket_futures = []
+            for length, pattern_idxs in buckets.items():
+                keys = np.array(
+                    [int(patterns[idx].translate(_BASE_DIGITS), 4) for idx in pattern_idxs],
+                    dtype=np.uint64
+                )
+                order = np.argsort(keys)
+                keys = keys[order]
+                key_patterns = np.array(pattern_idxs, dtype=np.int64)[order]
+                
+                n_starts = len(target_codes) - length + 1
+                futures = [
+                    executor.submit(
+                        self._rolling_scan, target_codes, length, keys, lo, min(lo + _SCAN_CHUNK, n_starts)
+                    )
+                    for lo in range(0, n_starts, _SCAN_CHUNK)
+                ]
+                bucket_futures.append((key_patterns, futures))
+            
+            for key_patterns, futures in bucket_futures:
+                chunk_starts = []
+                chunk_key_ids = []
+                for future in futures:
+                    if cancel_event is not None and cancel_event.is_set():
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        return pattern_starts
+                    starts, key_ids = future.result()
+                    chunk_starts.append(starts)
+                    chunk_key_ids.append(key_ids)
+                # Chunks are in target order, so starts ascend within each key
+                self._group_hits(
+                    key_patterns[np.concatenate(chunk_key_ids)],
+                    np.concatenate(chunk_starts) + 1,
+                    pattern_starts
+                )
+        
+        return pattern_starts
+    
+    def _rolling_scan(self, target_codes, length: int, keys, lo: int, hi: int):
+        """
+        Run the rolling scan kernel for windows starting in [lo, hi)
+        Returns arrays: (0-based start positions, key indexes)
+        """
+        window = target_codes[lo:hi + length - 1]
+        
+        # Rerun with exact capacity if the first guess was too small
+        capacity = 1 << 16
+        while True:
+            starts = np.empty(capacity, dtype=np.int64)
+            key_ids = np.empty(capacity, dtype=np.int64)
+            count = _rolling_scan_kernel(window, length, keys, starts, key_ids)
+            if count <= capacity:
+                break
+            capacity = count
+        
+        return starts[:count] + lo, key_ids[:count]
+    
+    def find_all_matches(self, probe_seqs: List[str], target_seq: str,
+                         probe_revcomps: Optional[List[str]] = None,
+                         cancel_event: Optional[threading.Event] = None) -> Tuple[array, array, array]:
+        """
+        Find all occurrences of every upper-case probe in the upper-case target_seq
+        Returns parallel arrays: (probe indexes, orientation codes, 1-based start
+        positions), ordered by probe, orientation, then position; empty if cancelled
+        """
+        if probe_revcomps is None:
+            probe_revcomps = [self.reverse_complement(seq) for seq in probe_seqs]
+        # Distinct sequence -> reverse complement
+        unique_seqs = dict(zip(probe_seqs, probe_revcomps))
+        
+        if not (_HS_AVAILABLE or _AC_AVAILABLE or _NUMBA_AVAILABLE):
+            target_bytes = target_seq.encode('ascii')
+            seq_starts = {}
+            for seq, rev_comp in unique_seqs.items():
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+                seq_starts[seq] = self.find_matches(seq.encode('ascii'), target_bytes, rev_comp.encode('ascii'))
+        else:
+            seq_starts = self._find_unique_matches(unique_seqs, target_seq, cancel_event)
+        
+        probe_idxs = array('i')
+        orientations = array('B')
+        starts = array('q')
+        if cancel_event is not None and cancel_event.is_set():
+            return probe_idxs, orientations, starts
+        
+        # Fan each sequence's start columns out to every probe sharing it
+        # with C-level array copies rather than one object per match
+        for i, probe_seq in enumerate(probe_seqs):
+            for orientation, orientation_starts in enumerate(seq_starts[probe_seq]):
+                if orientation_starts:
+                    starts.extend(orientation_starts)
+                    probe_idxs.extend(array('i', [i]) * len(orientation_starts))
+                    orientations.extend(array('B', [orientation]) * len(orientation_starts))
+        
+        return probe_idxs, orientations, starts
+    
+    def _find_unique_matches(self, unique_seqs: Dict[str, str], target_seq: str,
+                             cancel_event: Optional[threading.Event] = None) -> Dict[str, Tuple[array, array]]:
+        """
+        Find all occurrences of distinct upper-case sequences, given as a
+        dict of sequence -> reverse complement, in the upper-case target_seq
+        with one multi-pattern scan: CUDA for very large targets when a GPU is
+        available, otherwise Hyperscan, Aho-Corasick or Numba, in that order.
+        The CUDA scan ignores cancel_event and always runs to completion
+        Returns dict: sequence -> (5′→3′ start positions, 3′→5′ start positions)
+        """
+        # Each distinct forward and reverse complement pattern is scanned
+        # once; one sequence's reverse complement may be another's forward
+        # sequence, so (sequence, orientation) pairs can share a pattern
+        patterns: Dict[str, int] = {}
+        seq_patterns = []
+        for seq, rev_comp in unique_seqs.items():
+            forward_idx = patterns.setdefault(seq, len(patterns))
+            # Palindromes are reported once, as forward matches
+            reverse_idx = patterns.setdefault(rev_comp, len(patterns)) if rev_comp != seq else None
+            seq_patterns.append((seq, forward_idx, reverse_idx))
+        
+        pattern_list = list(patterns)
+        use_cuda = (
+            _CUDA_AVAILABLE
+            and len(target_seq) > _CUDA_MIN_TARGET_LENGTH
+            and max(map(len, pattern_list)) <= _CUDA_MAX_PATTERN_LENGTH
+        )
+        if use_cuda:
+            pattern_starts = self._scan_cuda(pattern_list, target_seq.encode('ascii'))
+        elif _HS_AVAILABLE:
+            pattern_starts = self._scan_hyperscan(pattern_list, target_seq.encode('ascii'), cancel_event)
+        elif _AC_AVAILABLE:
+            # pyahocorasick is built for str keys and haystacks
+            pattern_starts = self._scan_aho_corasick(pattern_list, target_seq, cancel_event)
+        else:
+            pattern_starts = self._scan_numba(pattern_list, target_seq.encode('ascii'), cancel_event)
+        
+        # Shared patterns hand out the same start column; it is only read
+        return {
+            seq: (
+                pattern_starts[forward_idx],
+                pattern_starts[reverse_idx] if reverse_idx is not None else array('q')
+            )
+            for seq, forward_idx, reverse_idx in seq_patterns
+        }
     
     def search_matches(self):
         """Main search function - find all probe matches in target sequence"""
-        # Get target sequence
-        target_seq = self.seq_text.get("1.0", tk.END).strip()
-        target_seq = ''.join(target_seq.split())  # Remove all whitespace
+        # Get target sequence with all whitespace removed
+        target_seq = self.seq_text.get("1.0", tk.END).translate(_WHITESPACE_TABLE)
         
         if not target_seq:
             messagebox.showwarning("Warning", "Please enter a target nucleotide sequence.")
             return
         
-        if not self.probes:
+        if not self.probe_seqs:
             messagebox.showwarning("Warning", "Please upload a probe CSV file first.")
             return
         
         # Validate sequence contains only valid nucleotides
-        valid_bases = set('ATGCatgc')
-        if not all(base in valid_bases for base in target_seq):
+        if not self.is_valid_sequence(target_seq):
             messagebox.showerror(
                 "Error",
                 "Target sequence contains invalid characters.\nOnly A, T, G, C are allowed."
             )
             return
         
-        # Update status
+        # Update status and lock the controls that would change the inputs
         self.status_label.config(text="Searching...", foreground="orange")
-        self.root.update_idletasks()
+        self.search_btn.config(state="disabled")
+        self.upload_btn.config(state="disabled")
+        self.clear_btn.config(state="disabled")
+        self.cancel_btn.config(state="normal")
+        
+        # Run the scan off the Tk main thread; results are handed back via after()
+        self.cancel_event = threading.Event()
+        worker = threading.Thread(
+            target=self._run_search,
+            args=(
+                target_seq.upper(),
+                self.probe_names,
+                self.probe_seqs,
+                self.probe_revcomps,
+                self.cancel_event
+            ),
+            daemon=True
+        )
+        worker.start()
+    
+    def _run_search(self, target_seq: str, probe_names: List[str], probe_seqs: List[str],
+                    probe_revcomps: List[str], cancel_event: threading.Event):
+        """
+        Worker thread body - find all probe matches in the upper-cased target
+        and schedule _finish_search on the Tk main thread
+        """
+        try:
+            # Names, end positions and matched sequences are derived on
+            # demand from match_source instead of being stored per match
+            matches = self.find_all_matches(probe_seqs, target_seq, probe_revcomps, cancel_event)
+        except Exception as e:
+            self.root.after(0, self._finish_search, None, str(e), None)
+            return
         
-        # Perform search
-        self.matches = []
+        # A cancelled scan may have stopped early, so its matches are dropped
+        if cancel_event.is_set():
+            matches = None
+        self.root.after(0, self._finish_search, matches, None, (target_seq, probe_names, probe_seqs))
+    
+    def _finish_search(self, matches: Optional[Tuple[array, array, array]], error: Optional[str],
+                       source: Optional[Tuple[str, List[str], List[str]]]):
+        """Apply search results on the Tk main thread and unlock the controls"""
+        self.search_btn.config(state="normal")
+        self.upload_btn.config(state="normal")
+        self.clear_btn.config(state="normal")
+        self.cancel_btn.config(state="disabled")
+        
+        if error is not None:
+            messagebox.showerror("Error", f"Search failed:\n{error}")
+            self.status_label.config(text="Search failed", foreground="red")
+            return
         
-        # Search each probe
-        for probe in self.probes:
-            probe_matches = self.find_matches(probe['sequence'], target_seq)
-            
-            for start, end, match_type in probe_matches:
-                # Extract matched sequence from target
-                matched_seq = target_seq[start-1:end].upper()
-                
-                self.matches.append({
-                    'probe_name': probe['name'],
-                    'match_type': match_type,
-                    'start_pos': start,
-                    'end_pos': end,
-                    'matched_seq': matched_seq
-                })
+        if matches is None:
+            self.status_label.config(text="Search cancelled", foreground="blue")
+            return
+        
+        self.match_probe_idxs, self.match_orientations, self.match_starts = matches
+        self.match_source = source
         
         # Update results display
         self._update_results()
     
+    def cancel_search(self):
+        """Ask the running search to stop at its next checkpoint"""
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+        self.cancel_btn.config(state="disabled")
+        self.status_label.config(text="Cancelling...", foreground="orange")
+    
     def _update_results(self):
         """Update GUI with search results"""
         # Clear existing results
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Add new results
-        for match in self.matches:
-            self.tree.insert("", tk.END, values=(
-                match['probe_name'],
-                match['match_type'],
-                match['start_pos'],
-                match['end_pos'],
-                match['matched_seq']
-            ))
+        self.tree.delete(*self.tree.get_children())
+        self.rows_shown = 0
+        
+        # Add the first page of results; more are added on scroll
+        self._show_more_results()
         
         # Update summary
-        if self.matches:
+        if self.match_starts:
             self.summary_label.config(
-                text=f"Found {len(self.matches)} match(es)",
+                text=f"Found {len(self.match_starts)} match(es)",
                 foreground="green"
             )
             self.save_btn.config(state="normal")
             self.status_label.config(
-                text=f"Search complete: {len(self.matches)} matches found",
+                text=f"Search complete: {len(self.match_starts)} matches found",
                 foreground="green"
             )
         else:
@@ -388,9 +904,34 @@ class ProbeMatcherApp:
             )
             self.status_label.config(text="Search complete: No matches", foreground="blue")
     
+    def _show_more_results(self):
+        """Insert the next page of matches into the results table"""
+        page_end = min(self.rows_shown + _RESULTS_PAGE_SIZE, len(self.match_starts))
+        for i in range(self.rows_shown, page_end):
+            self.tree.insert("", tk.END, values=self._match_row(i))
+        self.rows_shown = page_end
+    
+    def _match_row(self, i: int) -> Tuple[str, str, int, int, str]:
+        """
+        Build the display and export row of match i:
+        (probe_name, match_type, start_pos, end_pos, matched_seq)
+        """
+        target_seq, probe_names, probe_seqs = self.match_source
+        probe_idx = self.match_probe_idxs[i]
+        start = self.match_starts[i]
+        end = start + len(probe_seqs[probe_idx]) - 1
+        match_type = _MATCH_TYPES[self.match_orientations[i]]
+        return (probe_names[probe_idx], match_type, start, end, target_seq[start-1:end])
+    
+    def _on_tree_scroll(self, first, last):
+        """Update the scrollbar and load more rows once the end is reached"""
+        self.tree_vsb.set(first, last)
+        if float(last) >= 1.0 and self.rows_shown < len(self.match_starts):
+            self._show_more_results()
+    
     def save_results(self):
         """Save match results to CSV file"""
-        if not self.matches:
+        if not self.match_starts:
             messagebox.showinfo("Info", "No results to save.")
             return
         
@@ -405,7 +946,7 @@ class ProbeMatcherApp:
             return
         
         try:
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            with open(file_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
                 writer = csv.writer(f)
                 
                 # Write header
@@ -418,14 +959,7 @@ class ProbeMatcherApp:
                 ])
                 
                 # Write data
-                for match in self.matches:
-                    writer.writerow([
-                        match['probe_name'],
-                        match['match_type'],
-                        match['start_pos'],
-                        match['end_pos'],
-                        match['matched_seq']
-                    ])
+                writer.writerows(self._match_row(i) for i in range(len(self.match_starts)))
             
             messagebox.showinfo(
                 "Success",
@@ -447,14 +981,19 @@ class ProbeMatcherApp:
             return
         
         # Clear data
-        self.probes = []
-        self.matches = []
+        self.probe_names = []
+        self.probe_seqs = []
+        self.probe_revcomps = []
+        self.match_probe_idxs = array('i')
+        self.match_orientations = array('B')
+        self.match_starts = array('q')
+        self.match_source = None
         self.probe_file_path = None
         
         # Clear GUI elements
         self.seq_text.delete("1.0", tk.END)
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
+        self.rows_shown = 0
         
         # Reset labels and buttons
         self.probe_label.config(text="No file uploaded", foreground="gray")